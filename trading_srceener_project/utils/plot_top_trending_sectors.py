@@ -1,78 +1,145 @@
 ﻿
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Non-interactive backend, safe inside worker processes
 import matplotlib.pyplot as plt
-import os
 
 # ─────────────────────────────────────────────
 # CONFIGURATION
 # ─────────────────────────────────────────────
 DATA_DIR = "data"
-SECTOR_RETURNS_CSV = os.path.join(DATA_DIR, "sector_history.csv")
-SECTOR_SLOPES_CSV = os.path.join(DATA_DIR, "sector_slopes.csv")
-INDUSTRY_RETURNS_CSV = os.path.join(DATA_DIR, "industry_history.csv")
-INDUSTRY_SLOPES_CSV = os.path.join(DATA_DIR, "industry_slopes.csv")
-OUTPUT_PLOT_SECTOR = os.path.join(DATA_DIR, "top_sector_50MA.jpeg")
-OUTPUT_PLOT_INDUSTRY = os.path.join(DATA_DIR, "top_industry_50MA.jpeg")
-
-MA_WINDOW = 50
-TOP_N = 5
+GROUP_FILES = {
+    "Sector": (os.path.join(DATA_DIR, "sector_history.csv"), os.path.join(DATA_DIR, "sector_slopes.csv")),
+    "Industry": (os.path.join(DATA_DIR, "industry_history.csv"), os.path.join(DATA_DIR, "industry_slopes.csv")),
+}
+RENDER_CACHE_FILE = os.path.join(DATA_DIR, "plot_render_cache.json")
+
+MA_WINDOWS = [50]       # e.g., [20, 50, 200] to render one chart per window
+TOP_N_CHOICES = [5]     # e.g., [5, 10] to render one chart per top-N
+MAX_WORKERS = None      # None = one worker per CPU
+RENDER_VERSION = "1"    # Bump to force a re-render when the chart layout changes
 # ─────────────────────────────────────────────
 
-def plot_top_trending_groups_ma(return_df, slope_series, group_type="Sector", top_n=5, window=50, output_path=None):
+# Figure reused across renders within a worker process
+_FIGURE = None
+
+def load_group_data(returns_path, slopes_path):
+    return_df = pd.read_csv(returns_path, index_col="Date", parse_dates=True)
+    slope_series = pd.read_csv(slopes_path, index_col=0)
+    if isinstance(slope_series, pd.DataFrame):
+        slope_series = slope_series.iloc[:, 0]
+    return return_df, slope_series
+
+def output_path_for(group_type, top_n, window):
+    return os.path.join(DATA_DIR, f"top{top_n}_{group_type.lower()}_{window}MA.jpeg")
+
+def prepare_ma_data(return_df, slope_series, top_n, window):
     top_groups = slope_series.dropna().sort_values(ascending=False).head(top_n).index.tolist()
     ma_df = return_df[top_groups].rolling(window=window).mean().dropna()
 
     # Limit to last `window` rows
-    ma_df = ma_df.tail(window)
+    return ma_df.tail(window)
+
+def data_fingerprint(ma_df, group_type, top_n, window):
+    digest = hashlib.sha256()
+    digest.update(f"{RENDER_VERSION}|{group_type}|{top_n}|{window}|".encode())
+    digest.update("|".join(map(str, ma_df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(ma_df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+def load_render_cache(filepath):
+    if os.path.exists(filepath):
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def save_render_cache(filepath, cache):
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
 
-    plt.figure(figsize=(14, 7))
-    for group in top_groups:
-        plt.plot(ma_df.index, ma_df[group], label=f"{group} (50MA)")
+def plot_top_trending_groups_ma(ma_df, group_type="Sector", top_n=5, window=50, output_path=None):
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(figsize=(14, 7))
+    fig = _FIGURE
+    fig.clear()
+    ax = fig.add_subplot(111)
 
-    plt.title(f"Top {top_n} {group_type}s by 50-Day Moving Average")
-    plt.xlabel("Date")
-    plt.ylabel("50-Day Avg Daily Return")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
+    for group in ma_df.columns:
+        ax.plot(ma_df.index, ma_df[group], label=f"{group} ({window}MA)")
+
+    ax.set_title(f"Top {top_n} {group_type}s by {window}-Day Moving Average")
+    ax.set_xlabel("Date")
+    ax.set_ylabel(f"{window}-Day Avg Daily Return")
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, format='jpeg')
-    plt.close()
+        fig.savefig(output_path, format='jpeg')
+
+def render_chart(ma_df, group_type, top_n, window, output_path):
+    start = time.perf_counter()
+    plot_top_trending_groups_ma(ma_df, group_type=group_type, top_n=top_n, window=window, output_path=output_path)
+    return time.perf_counter() - start
+
+def build_render_jobs(cache):
+    jobs = []
+    skipped = []
+    for group_type, (returns_path, slopes_path) in GROUP_FILES.items():
+        print(f"📥 Loading {group_type.lower()} data...")
+        return_df, slope_series = load_group_data(returns_path, slopes_path)
+
+        for window in MA_WINDOWS:
+            for top_n in TOP_N_CHOICES:
+                output_path = output_path_for(group_type, top_n, window)
+                ma_df = prepare_ma_data(return_df, slope_series, top_n, window)
+                fingerprint = data_fingerprint(ma_df, group_type, top_n, window)
+
+                if cache.get(output_path) == fingerprint and os.path.exists(output_path):
+                    skipped.append(output_path)
+                else:
+                    jobs.append((ma_df, group_type, top_n, window, output_path, fingerprint))
+    return jobs, skipped
 
 if __name__ == "__main__":
-    # Load sector data
-    print("📥 Loading sector data...")
-    sector_returns = pd.read_csv(SECTOR_RETURNS_CSV, index_col="Date", parse_dates=True)
-    sector_slopes = pd.read_csv(SECTOR_SLOPES_CSV, index_col=0)
-    if isinstance(sector_slopes, pd.DataFrame):
-        sector_slopes = sector_slopes.iloc[:, 0]
-
-    print("💾 Saving top sector 50MA plot...")
-    plot_top_trending_groups_ma(
-        return_df=sector_returns,
-        slope_series=sector_slopes,
-        group_type="Sector",
-        top_n=TOP_N,
-        window=MA_WINDOW,
-        output_path=OUTPUT_PLOT_SECTOR
-    )
-
-    # Load industry data
-    print("📥 Loading industry data...")
-    industry_returns = pd.read_csv(INDUSTRY_RETURNS_CSV, index_col="Date", parse_dates=True)
-    industry_slopes = pd.read_csv(INDUSTRY_SLOPES_CSV, index_col=0)
-    if isinstance(industry_slopes, pd.DataFrame):
-        industry_slopes = industry_slopes.iloc[:, 0]
-
-    print("💾 Saving top industry 50MA plot...")
-    plot_top_trending_groups_ma(
-        return_df=industry_returns,
-        slope_series=industry_slopes,
-        group_type="Industry",
-        top_n=TOP_N,
-        window=MA_WINDOW,
-        output_path=OUTPUT_PLOT_INDUSTRY
-    )
-
-    print("\n✅ 50-Day MA trend graphs saved as JPEGs.")
\ No newline at end of file
+    run_start = time.perf_counter()
+    cache = load_render_cache(RENDER_CACHE_FILE)
+    jobs, skipped = build_render_jobs(cache)
+
+    for output_path in skipped:
+        print(f"⏭️ {output_path}: input unchanged, skipping render")
+
+    render_times = []
+    if jobs:
+        print(f"💾 Rendering {len(jobs)} chart(s)...")
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(render_chart, ma_df, group_type, top_n, window, output_path): (output_path, fingerprint)
+                for ma_df, group_type, top_n, window, output_path, fingerprint in jobs
+            }
+            for future in as_completed(futures):
+                output_path, fingerprint = futures[future]
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    print(f"⚠️ {output_path}: Error rendering chart - {e}")
+                    continue
+                render_times.append(elapsed)
+                cache[output_path] = fingerprint
+                print(f"🖼️ {output_path}: rendered in {elapsed:.2f}s")
+
+        save_render_cache(RENDER_CACHE_FILE, cache)
+
+    total = len(jobs) + len(skipped)
+    hit_rate = len(skipped) / total if total else 0.0
+    avg_render = sum(render_times) / len(render_times) if render_times else 0.0
+    print(f"\n✅ {len(render_times)} chart(s) rendered, {len(skipped)} cached "
+          f"(cache hit rate {hit_rate:.0%}, avg render {avg_render:.2f}s/chart, "
+          f"total {time.perf_counter() - run_start:.2f}s).")